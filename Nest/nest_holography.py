@@ -1,15 +1,40 @@
 import numpy as np
 import os
+import glob
+import re
+import json
 import pickle
+import threading
+from collections import OrderedDict
 
 # --- GENESIS PHYSICS CONSTANTS ---
 DIMENSIONS = 1024  # The width of our holographic plate (Higher = clearer memories)
 DENSITY = 0.1      # How "sparse" the vectors are (Biological neurons are sparse)
 
+# --- ENCODING CACHE ---
+ENCODING_CACHE_BYTES = 32 * 1024 * 1024  # Memory cap for cached token contributions
+TOKEN = re.compile(r"\s*\S{1,16}|\s+")  # A word with its leading space (long words split at 16)
+
+# --- ANCHOR TABLES (Cleanup Memory) ---
+NEST_DATA = os.path.expanduser("~/Genesis/nest_data")
+ANCHOR_TABLES = {
+    "REFLEX": "reflex_storage",
+    "EMOTION": "emotion_storage",
+    "THOUGHT": "thought_storage",
+    "LEXICON": "lexicon",
+}
+
 class HolographicEngine:
-    def __init__(self):
+    def __init__(self, cache_bytes=ENCODING_CACHE_BYTES):
         self.lexicon_path = os.path.expanduser("~/Genesis/nest_data/lexicon.pkl")
         self.lexicon = self._load_or_create_lexicon()
+        # Token -> its un-binarized contribution at offset 0 (LRU, bounded by cache_bytes)
+        self.encoding_cache = OrderedDict()
+        self.cache_bytes = cache_bytes
+        self.cache_used = 0
+        self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.cache_lock = threading.Lock()  # One engine is shared by concurrent journals/searches
+        self.cleanup_memory = None  # Built on the first cleanup() call
 
     def _load_or_create_lexicon(self):
         """
@@ -36,28 +61,81 @@ class HolographicEngine:
                 pickle.dump(lexicon, f)
             return lexicon
 
+    def _token_wave(self, token):
+        """
+        The pre-binarization sum of one token, as if it started at position 0.
+        Since every character is shifted by its position, the same token at
+        offset k contributes exactly np.roll(wave, k) — so one entry serves all offsets.
+        """
+        with self.cache_lock:
+            wave = self.encoding_cache.get(token)
+            if wave is not None:
+                self.encoding_cache.move_to_end(token)
+                self.cache_stats["hits"] += 1
+                return wave
+            self.cache_stats["misses"] += 1
+
+        # Encode outside the lock; other threads keep hitting the cache meanwhile
+        wave = np.zeros(DIMENSIONS, dtype=np.int64)
+        for index, char in enumerate(token):
+            if char in self.lexicon:
+                wave += np.roll(self.lexicon[char], index)
+
+        size = wave.nbytes + len(token)
+        if size <= self.cache_bytes:
+            with self.cache_lock:
+                if token not in self.encoding_cache:  # Another thread may have encoded it too
+                    self.encoding_cache[token] = wave
+                    self.cache_used += size
+                    while self.cache_used > self.cache_bytes:
+                        old_token, old_wave = self.encoding_cache.popitem(last=False)
+                        self.cache_used -= old_wave.nbytes + len(old_token)
+                        self.cache_stats["evictions"] += 1
+        return wave
+
     def text_to_hologram(self, text):
         """
         Transmutes Text -> Vector (Encoding).
         Uses 'Cyclic Shift' to preserve order (C-A-T is different from A-C-T).
+        Repeated words are not re-encoded: their contributions come from the encoding cache.
         """
         if not text: return np.zeros(DIMENSIONS)
         
         hologram = np.zeros(DIMENSIONS)
         
-        for index, char in enumerate(text):
-            if char in self.lexicon:
-                vec = self.lexicon[char]
-                # Shift vector by position to encode sequence
-                shifted_vec = np.roll(vec, index)
-                # Superposition (Addition)
-                hologram += shifted_vec
+        for match in TOKEN.finditer(text):
+            # Shift the token's wave by its position in the text, then superpose
+            hologram += np.roll(self._token_wave(match.group()), match.start())
         
         # Binarize (Flatten back to 0/1 for storage efficiency)
         # This creates the 'Fingerprint'
         hologram = np.where(hologram > 0.5, 1, 0)
         return hologram
 
+    def texts_to_holograms(self, texts):
+        """
+        Batch Encoding. One row per text (N x DIMENSIONS), sharing the encoding cache.
+        """
+        if len(texts) == 0:
+            return np.zeros((0, DIMENSIONS), dtype=int)
+        return np.stack([self.text_to_hologram(text) for text in texts])
+
+    def encoding_cache_info(self):
+        """
+        Hit rate and memory use of the encoding cache.
+        """
+        with self.cache_lock:
+            return self._cache_report()
+
+    def _cache_report(self):
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        report = dict(self.cache_stats)
+        report["hit_rate"] = self.cache_stats["hits"] / lookups if lookups else 0.0
+        report["tokens"] = len(self.encoding_cache)
+        report["bytes_used"] = self.cache_used
+        report["bytes_cap"] = self.cache_bytes
+        return report
+
     def calculate_resonance(self, vec_a, vec_b):
         """
         Measures Similarity (Resonance).
@@ -67,6 +145,14 @@ class HolographicEngine:
         matches = np.sum(vec_a == vec_b)
         return matches / DIMENSIONS
 
+    def calculate_resonance_many(self, vec, sheet):
+        """
+        Resonance of one vector against every row of a sheet (N x DIMENSIONS).
+        Same score as calculate_resonance, in a single vectorized pass.
+        """
+        matches = np.sum(np.asarray(sheet) == vec, axis=1)
+        return matches / DIMENSIONS
+
     def bind_energy(self, content_vector, energy_level):
         """
         Applies 'Weight' (Arousal).
@@ -74,4 +160,133 @@ class HolographicEngine:
         """
         # For binary vectors, we can't scale magnitude directly in the array.
         # So we return a tuple: (Vector, Energy_Scalar)
-        return (content_vector, energy_level)
\ No newline at end of file
+        return (content_vector, energy_level)
+
+    # --- VSA ALGEBRA (Phase Space) ---
+    # All operations broadcast: pass one vector (DIMENSIONS,) or a batch (N, DIMENSIONS).
+
+    def bind(self, vec_a, vec_b):
+        """
+        Binding (A ⊗ B). Elementwise phasor product: the phases add.
+        The result resembles neither input.
+        """
+        return np.asarray(vec_a, dtype=np.complex128) * np.asarray(vec_b, dtype=np.complex128)
+
+    def unbind(self, bound, key):
+        """
+        Unbinding (A ⊗ B ⊗ B*). Multiplies by the conjugate of the key: the key's phases cancel.
+        For unit phasors this recovers the partner exactly.
+        """
+        return np.asarray(bound, dtype=np.complex128) * np.conj(np.asarray(key, dtype=np.complex128))
+
+    def bundle(self, vectors, weights=None):
+        """
+        Bundling (A + B + ...). Superposes along the first axis, then projects
+        every component back onto the unit circle. Fully cancelled components stay 0.
+        """
+        vectors = np.asarray(vectors, dtype=np.complex128)
+        if weights is not None:
+            vectors = vectors * np.asarray(weights, dtype=np.float64).reshape(-1, *([1] * (vectors.ndim - 1)))
+        total = vectors.sum(axis=0)
+        magnitude = np.abs(total)
+        return np.divide(total, magnitude, out=np.zeros_like(total), where=magnitude > 0)
+
+    def permute(self, vectors, shift=1):
+        """
+        Permutation (ρ). Cyclic shift along the last axis, as in text_to_hologram.
+        Use a negative shift to undo.
+        """
+        return np.roll(vectors, shift, axis=-1)
+
+    def cleanup(self, vectors, top_k=3, tables=None):
+        """
+        Decodes vectors (e.g. the result of unbind, or raw crystals) to their nearest anchors.
+        See CleanupMemory.decode.
+        """
+        if self.cleanup_memory is None:
+            self.cleanup_memory = CleanupMemory()
+        return self.cleanup_memory.decode(vectors, top_k=top_k, tables=tables)
+
+
+class CleanupMemory:
+    """
+    The Mirror of Anchors.
+    Packs every Reflex / Emotion / Thought / Lexicon vector into one matrix,
+    so decoding any number of vectors is a single matrix product.
+    """
+    def __init__(self, data_dir=NEST_DATA):
+        self.data_dir = data_dir
+        self.labels = []    # (table, id, name) per row
+        self.matrix = self._pack()
+        self.tables = np.array([label[0] for label in self.labels])  # For filtering
+
+    def _pack(self):
+        rows = []
+        for table, folder in ANCHOR_TABLES.items():
+            for path in sorted(glob.glob(os.path.join(self.data_dir, folder, "*.npy"))):
+                try:
+                    vec = np.load(path)
+                except (OSError, ValueError):
+                    continue  # Not an anchor (e.g. a pickled crystal saved into this folder)
+                if vec.shape != (DIMENSIONS,):
+                    continue
+                anchor_id = os.path.basename(path)[:-len(".npy")]
+                rows.append(vec.astype(np.complex128))
+                self.labels.append((table, anchor_id, self._name(path, anchor_id)))
+
+        if not rows:
+            return np.zeros((0, DIMENSIONS), dtype=np.complex128)
+        matrix = np.stack(rows)
+        # Unit rows, so scores compare anchors fairly (lexicon waves are half-magnitude hybrids)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _name(self, path, anchor_id):
+        """
+        Human name of an anchor from its .meta.json (lexicon word or standard description).
+        """
+        meta_path = path[:-len(".npy")] + ".meta.json"
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return anchor_id
+        if "identity" in meta:
+            return meta["identity"].get("word", anchor_id)
+        return meta.get("description", anchor_id).split(" - ")[0]
+
+    def decode(self, vectors, top_k=3, tables=None):
+        """
+        Scores vectors against the packed anchors in one product: |V · A*| / |V|.
+        ARGS:
+            vectors (array): One vector (DIMENSIONS,) or a batch (N, DIMENSIONS).
+            top_k (int): Anchors to return per vector.
+            tables (list): Restrict to e.g. ["EMOTION", "REFLEX"]. None = all.
+        Returns a list (one per vector) of [(score, table, id, name), ...], best first.
+        A single vector returns just its list.
+        """
+        vectors = np.asarray(vectors, dtype=np.complex128)
+        single = vectors.ndim == 1
+        batch = np.atleast_2d(vectors)
+
+        matrix, labels = self.matrix, self.labels
+        if tables is not None:
+            keep = np.isin(self.tables, tables)
+            matrix = matrix[keep]
+            labels = [label for label, k in zip(labels, keep) if k]
+        if len(labels) == 0:
+            decoded = [[] for _ in batch]
+            return decoded[0] if single else decoded
+
+        norms = np.linalg.norm(batch, axis=1, keepdims=True)
+        scores = np.abs(batch @ matrix.conj().T)
+        np.divide(scores, norms, out=scores, where=norms > 0)
+
+        k = min(top_k, len(labels))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        decoded = []
+        for row, candidates in zip(scores, top):
+            ranked = candidates[np.argsort(-row[candidates])]
+            decoded.append([(float(row[i]), *labels[i]) for i in ranked])
+        return decoded[0] if single else decoded
\ No newline at end of file
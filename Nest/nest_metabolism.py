@@ -1,6 +1,9 @@
 import os
+import re
 import time
 import json
+import uuid
+import threading
 import numpy as np
 import nest_holography 
 
@@ -9,11 +12,83 @@ DATA_DIR = os.path.expanduser("~/Genesis/nest_data")
 REFLEX_DIR = os.path.join(DATA_DIR, "reflex_storage")
 EMOTION_DIR = os.path.join(DATA_DIR, "emotion_storage")
 LEXICON_DIR = os.path.join(DATA_DIR, "lexicon")
+CRYSTAL_NAME = re.compile(r"^mem_(\d{12})\.npy$")  # mem_000000000042.npy -> sequence 42
+INCOMING_DIR = ".incoming"   # Per-sector folder for crystals still being written
+STALE_TMP_AGE = 3600         # Seconds before an abandoned temp file is swept away
+HIGH_WATER = ".high_water"   # Per-sector file: highest sequence id ever committed
+
+def crystal_path(location, sequence):
+    return os.path.join(location, f"mem_{sequence:012d}.npy")
+
+def first_free_sequence(location, after):
+    """
+    Smallest sequence id above `after` with no committed crystal.
+    `after` must be a high-water mark: ids above it are only ever taken in order,
+    so they form a dense run. Gallop forward, then binary-search the end of the run.
+    O(log n) stats, however far behind the mark is.
+    """
+    low, step = after, 1
+    while os.path.exists(crystal_path(location, low + step)):
+        low += step
+        step *= 2
+    high = low + step
+    while high - low > 1:
+        mid = (low + high) // 2
+        if os.path.exists(crystal_path(location, mid)):
+            low = mid
+        else:
+            high = mid
+    return high
+
+def record_high_water(location, sequence):
+    """
+    Raises the sector's persisted high-water mark (best effort; never lowers it on purpose).
+    A racing writer may briefly overwrite it with a smaller value; the gallop in
+    last_sequence walks over the difference.
+    """
+    path = os.path.join(location, HIGH_WATER)
+    try:
+        with open(path, 'r') as f:
+            if int(f.read().strip() or 0) >= sequence:
+                return
+    except (OSError, ValueError):
+        pass
+    tmp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(str(sequence))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only sector: readers fall back to a scan
+
+def last_sequence(location):
+    """
+    Highest sequence id ever committed in a sector.
+    Deleted crystals leave holes below it; those ids are never handed out again,
+    so a new crystal can never land behind a reader's watermark.
+    Sectors with no mark yet (written before it existed) are scanned once to seed it.
+    """
+    try:
+        with open(os.path.join(location, HIGH_WATER), 'r') as f:
+            mark = int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        mark = 0
+        try:
+            for entry in os.scandir(location):
+                match = CRYSTAL_NAME.match(entry.name)
+                if match:
+                    mark = max(mark, int(match.group(1)))
+        except OSError:
+            return 0
+        record_high_water(location, mark)
+    return first_free_sequence(location, mark) - 1
 
 class GenesisMemoryJournal:
     def __init__(self):
         self.physics = nest_holography.HolographicEngine()
         self.lexicon_map = self._load_lexicon_map()
+        self.sequence_hint = {}  # location -> last sequence id this journal saw committed
+        self.hardlinks = {}      # location -> False once os.link is refused there
 
     def _load_lexicon_map(self):
         """
@@ -63,10 +138,84 @@ class GenesisMemoryJournal:
         else:
             return np.zeros(1024, dtype=np.complex128)
 
+    def _prepare_sector(self, location):
+        """
+        First write to a sector from this journal: make the incoming folder,
+        sweep temp files abandoned by crashed writers, and seed the sequence hint
+        from the sector's high-water mark.
+        """
+        incoming = os.path.join(location, INCOMING_DIR)
+        if location in self.sequence_hint:
+            return incoming
+        os.makedirs(incoming, exist_ok=True)
+        cutoff = time.time() - STALE_TMP_AGE
+        for entry in os.scandir(incoming):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                continue  # Another journal swept it first
+        self.sequence_hint[location] = last_sequence(location)
+        return incoming
+
+    def _publish(self, tmp_path, filename, location):
+        """
+        Moves a complete temp crystal to its final name without ever overwriting.
+        Raises FileExistsError if another writer already holds that name.
+        """
+        if self.hardlinks.get(location, True):
+            try:
+                os.link(tmp_path, filename)
+                return
+            except FileExistsError:
+                raise
+            except OSError:
+                self.hardlinks[location] = False  # e.g. FUSE / SMB / exFAT mounts
+
+        # Fallback: reserve the name exclusively, then rename the full crystal over it.
+        # Readers may see the empty reservation for an instant and treat it as in-flight.
+        fd = os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        os.close(fd)
+        os.replace(tmp_path, filename)
+
+    def _commit(self, crystal, location):
+        """
+        Rename-on-commit with a monotonic sequence id.
+        1. Write the whole crystal to a private temp file in .incoming/ and fsync it.
+        2. Publish it as mem_<sequence>.npy, one above the sector's high-water mark.
+           Publishing never overwrites, so of any writers (threads or processes) racing
+           for the same id exactly one wins; the others jump straight to the first free id.
+           Holes left by deleted crystals are never refilled.
+        Readers never see a half-written crystal and never wait on a writer.
+        """
+        incoming = self._prepare_sector(location)
+        tmp_path = os.path.join(incoming, f"mem_tmp_{os.getpid()}_{threading.get_ident()}_{uuid.uuid4().hex}.npy")
+        with open(tmp_path, 'wb') as f:
+            np.save(f, crystal)
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            sequence = max(self.sequence_hint[location], last_sequence(location)) + 1
+            while True:
+                try:
+                    self._publish(tmp_path, crystal_path(location, sequence), location)
+                    break
+                except FileExistsError:
+                    sequence = first_free_sequence(location, sequence)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+        self.sequence_hint[location] = max(self.sequence_hint.get(location, 0), sequence)
+        record_high_water(location, sequence)
+        return sequence
+
     def crystallize(self, event_data, location):
         """
         The Act of Memorizing.
         Fuses Content + Emotion + Reflex into a single Phase Crystal.
+        Safe for many concurrent writers per sector. Returns the crystal's sequence id.
         """
         timestamp = time.time()
         content = event_data.get("content", "")
@@ -74,11 +223,10 @@ class GenesisMemoryJournal:
         reflex_name = event_data.get("reflex", "IGNORE")
         
         # 1. OBEDIENCE CHECK
-        if not os.path.exists(location):
-            try:
-                os.makedirs(location)
-            except OSError:
-                return
+        try:
+            os.makedirs(location, exist_ok=True)
+        except OSError:
+            return
 
         # --- THE TRINITY FUSION ---
         
@@ -131,9 +279,10 @@ class GenesisMemoryJournal:
         }
 
         # 5. STORE
-        filename = f"{location}/mem_{timestamp}.npy"
-        np.save(filename, crystal)
-        print(f" >> [SCRIBE] Crystal Fused: {emotion_name} + {reflex_name} -> {os.path.basename(location)}")
+        # The sequence id (not the float timestamp) names the file, so writers never collide.
+        sequence = self._commit(crystal, location)
+        print(f" >> [SCRIBE] Crystal Fused: {emotion_name} + {reflex_name} -> {os.path.basename(location)} #{sequence}")
+        return sequence
 
     def metabolic_sleep(self, target_folder):
         pass
\ No newline at end of file
@@ -1,11 +1,12 @@
 import os
-import glob
-import numpy as np
 import nest_holography 
+import nest_tiers
 
 class GenesisRecall:
-    def __init__(self):
+    def __init__(self, ram_budget=nest_tiers.RAM_BUDGET):
         self.physics = nest_holography.HolographicEngine()
+        # Hot (RAM) / Cold (disk) storage, so we never hold the whole bank at once
+        self.tiers = nest_tiers.TieredMemory(self.physics, ram_budget=ram_budget)
         
     def search(self, query, search_locations, threshold=0.1):
         """
@@ -26,19 +27,10 @@ class GenesisRecall:
             if not os.path.exists(folder):
                 continue
                 
-            memories = glob.glob(os.path.join(folder, "*.npy"))
-            
-            for mem_file in memories:
-                try:
-                    data = np.load(mem_file, allow_pickle=True).item()
-                    stored_vec = data['hologram']
-                    
-                    resonance = self.physics.calculate_resonance(query_vec, stored_vec)
-                    
-                    if resonance > threshold:
-                        results.append((resonance, data))
-                except:
-                    continue
+            # The tiers decide whether each crystal comes from RAM, a cold sheet, or its file.
+            # Writers commit whole crystals under fresh sequence ids, so the scan sees a clean
+            # snapshot: anything committed after it probes the sector belongs to the next search.
+            results.extend(self.tiers.scan(folder, query_vec, threshold))
         
         # 3. Sort
         results.sort(key=lambda x: x[0], reverse=True)
@@ -50,4 +42,10 @@ class GenesisRecall:
             top = results[0]
             print(f" >> [MNEMOSYNE] Match ({top[0]:.2f}): '{top[1]['raw_content']}'")
             
-        return results
\ No newline at end of file
+        return results
+
+    def tier_stats(self):
+        """
+        Hit rates per storage tier (hot RAM / cold disk / miss).
+        """
+        return self.tiers.tier_stats()
@@ -0,0 +1,662 @@
+import os
+import glob
+import json
+import time
+import uuid
+import pickle
+import threading
+import numpy as np
+import nest_holography
+import nest_metabolism
+
+# --- CONFIG ---
+RAM_BUDGET = 256 * 1024 * 1024  # Bytes the Hot tier (plus not-yet-frozen rows) may hold
+BLOCK_ROWS = 256                 # Sheet rows per resident Hot block (4 MiB of holograms)
+COLD_DIR = ".cold"               # Hidden per-sector folder (glob "*.npy" never sees it)
+LOW_WATER = 0.9                  # Eviction frees down to this fraction, so it runs in bursts
+ENTRY_OVERHEAD = 512             # Estimated Python bookkeeping bytes per resident entry
+FREEZE_ROWS = 1024               # Unfrozen rows that trigger writing a cold sheet...
+FREEZE_AGE = 60                  # ...or seconds the oldest unfrozen row may wait
+PENDING_SHARE = 0.25             # Fraction of the RAM budget unfrozen rows may take
+MAX_SHEETS = 8                   # Sheets per sector before the smallest are merged
+SCAN_BLOCK = 4096                # Rows copied per step when merging sheets (bounds temporaries)
+IN_FLIGHT_AGE = 5                # Seconds an unreadable crystal is assumed to be mid-commit
+STALE_AGE = 600                  # Seconds before a compaction lock or orphan file is abandoned
+LEGACY_DONE = "legacy.done"      # Marker: pre-sequence crystals already folded into sheets
+COMPACT_LOCK = "compact.lock"
+
+# One memory-mappable row per crystal. The text blob holds everything but the hologram (JSON).
+ROW = np.dtype([
+    ("name", "S255"),     # Filesystems cap a file name at 255 bytes, so every crystal fits
+    ("sequence", "i8"),   # 0 for legacy (timestamp-named) crystals
+    ("text_start", "i8"),
+    ("text_len", "i8"),
+    ("mass", "f8"),       # Copied from the crystal, so Hot blocks can be weighed unread
+    ("decay_factor", "f8"),
+])
+
+class TieredMemory:
+    """
+    The Two Tiers of Remembering.
+    HOT  : Blocks of sheet holograms resident in RAM, bounded by a byte budget. A scan
+           resonates them without touching the disk.
+    COLD : Per-sector sheets on disk (holograms, row table, crystal text), memory-mapped.
+           Blocks not resident are read from here. A cold read never opens a crystal file.
+    A MISS is a crystal read from its own file: new since the last scan, found by walking
+    sequence ids from the sector's watermark up to its high-water mark (the sector is never listed). Misses wait in
+    RAM until enough pile up to freeze into a new sheet; small sheets are merged over time.
+    """
+    def __init__(self, physics, ram_budget=RAM_BUDGET):
+        self.physics = physics
+        self.ram_budget = ram_budget
+        self.ram_used = 0
+        self.hot = {}              # (folder, stem, start row) -> {"holograms", "weight", "bytes", "touched"}
+        self.cold = {}             # folder -> sector state (see _open_cold)
+        self.clock = 0             # Logical clock for recency (immune to wall-clock jumps)
+        self.stats = {"hot_hits": 0, "cold_hits": 0, "misses": 0, "evictions": 0}
+        self.lock = threading.RLock()  # Guards tier bookkeeping only; disk reads run unlocked
+
+    # --- HOT TIER ---
+
+    def _crystal_bytes(self, data):
+        # raw_content is not always text (e.g. None for a visual_vector crystal)
+        return data['hologram'].nbytes + len(str(data.get('raw_content', ""))) + ENTRY_OVERHEAD
+
+    def _heat(self, entry):
+        """
+        Survival score of a Hot block. Lowest is evicted first.
+        Heavy (mass), fresh (decay_factor) and recently scanned blocks stay.
+        """
+        recency = 1.0 / (1 + self.clock - entry["touched"])
+        return entry["weight"] * recency
+
+    def _block_weight(self, sheet, start, stop):
+        rows = sheet["rows"]
+        if "mass" not in rows.dtype.names:
+            return 0.5  # Sheet written before rows carried mass: a crystal's default
+        return float(np.mean(rows["mass"][start:stop] * rows["decay_factor"][start:stop]))
+
+    def _admit(self, key, holograms, weight):
+        """
+        Makes a block resident. With the budget full, it only displaces blocks colder than
+        itself; a scan touches every block of a sector, so without that rule a sector larger
+        than the budget would evict each block just before it is needed again.
+        """
+        size = holograms.nbytes + ENTRY_OVERHEAD
+        if size > self.ram_budget:
+            return
+        with self.lock:
+            if key in self.hot:
+                return
+            entry = {"holograms": holograms, "weight": weight, "bytes": size, "touched": self.clock}
+            must = self.ram_used + size - self.ram_budget
+            if must > 0:
+                want = self.ram_used + size - self.ram_budget * LOW_WATER
+                heat = self._heat(entry)
+                victims, freed = [], 0
+                for victim, other in sorted(self.hot.items(), key=lambda item: self._heat(item[1])):
+                    if freed >= want or self._heat(other) >= heat:
+                        break
+                    victims.append(victim)
+                    freed += other["bytes"]
+                if freed < must:
+                    return  # Not hotter than what is resident: stays cold
+                for victim in victims:
+                    self.ram_used -= self.hot.pop(victim)["bytes"]
+                    self.stats["evictions"] += 1
+            self.hot[key] = entry
+            self.ram_used += size
+
+    def _evict(self):
+        """
+        Drops the coldest blocks until RAM use is back under its low-water mark
+        (pending misses count against the same budget). They are never lost: every Hot
+        block is a copy of a cold sheet.
+        """
+        target = self.ram_budget * LOW_WATER
+        for key, entry in sorted(self.hot.items(), key=lambda item: self._heat(item[1])):
+            if self.ram_used <= target:
+                break
+            del self.hot[key]
+            self.ram_used -= entry["bytes"]
+            self.stats["evictions"] += 1
+
+    def _drop_blocks(self, folder, stems):
+        with self.lock:
+            for key in [key for key in self.hot if key[0] == folder and key[1] in stems]:
+                self.ram_used -= self.hot.pop(key)["bytes"]
+
+    # --- CRYSTAL FILES ---
+
+    def _load_crystal(self, path):
+        try:
+            data = np.load(path, allow_pickle=True)
+            if data.shape != ():
+                return None  # Raw waveform (e.g. a Genesis axiom), not a crystal
+            data = data.item()
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+        if not isinstance(data, dict) or np.shape(data.get('hologram')) != (nest_holography.DIMENSIONS,):
+            return None
+        return data
+
+    def _is_young(self, path):
+        try:
+            return time.time() - os.stat(path).st_mtime < IN_FLIGHT_AGE
+        except OSError:
+            return False
+
+    # --- COLD TIER: SHEETS ---
+
+    def _open_cold(self, folder):
+        """
+        Brings a sector's view of its cold sheets up to date.
+        A sheet is published by its .json manifest (written last), so half-written sheets
+        are invisible. A merged sheet lists the sheets it supersedes; those are dropped
+        from the view as soon as it is attached, so no crystal is ever counted twice.
+        """
+        with self.lock:
+            sector = self.cold.get(folder)
+            if sector is None:
+                sector = {
+                    "sheets": {},         # stem -> attached sheet
+                    "retired": set(),     # stems superseded by an attached sheet
+                    "watermark": 0,       # highest sequence frozen or pending
+                    "pending": [],        # misses not yet frozen (resident, counted in ram_used)
+                    "pending_bytes": 0,
+                    "spilled": [],        # legacy names over budget, re-read each scan instead of held
+                    "legacy": False,      # legacy crystals listed (the listing happens once)
+                    "legacy_marked": False,
+                    "ingest": threading.Lock(),
+                }
+                self.cold[folder] = sector
+            known = set(sector["sheets"]) | sector["retired"]
+
+        # Directory listing, manifest reads and mmaps happen outside the lock
+        cold_path = os.path.join(folder, COLD_DIR)
+        mapped = []
+        for manifest_path in sorted(glob.glob(os.path.join(cold_path, "sheet_*.json"))):
+            stem = os.path.basename(manifest_path)[:-len(".json")]
+            if stem in known:
+                continue
+            try:
+                mapped.append(self._map_sheet(cold_path, stem))
+            except (OSError, ValueError, KeyError):
+                continue  # Removed by a compactor mid-listing
+        legacy = os.path.exists(os.path.join(cold_path, LEGACY_DONE))  # Another reader already folded them in
+
+        with self.lock:
+            for sheet in mapped:
+                stem = sheet["stem"]
+                if stem in sector["sheets"] or stem in sector["retired"]:
+                    continue  # Attached by another thread meanwhile
+                sector["sheets"][stem] = sheet
+                sector["retired"].update(sheet["supersedes"])
+                sector["watermark"] = max(sector["watermark"], sheet["max_sequence"])
+            for stem in list(sector["sheets"]):
+                if stem in sector["retired"]:
+                    del sector["sheets"][stem]
+            self._drop_blocks(folder, sector["retired"])
+            sector["legacy"] = sector["legacy"] or legacy
+            sector["legacy_marked"] = sector["legacy_marked"] or legacy
+            return sector
+
+    def _map_sheet(self, cold_path, stem):
+        base = os.path.join(cold_path, stem)
+        with open(f"{base}.json", 'r') as f:
+            manifest = json.load(f)
+        text_size = os.path.getsize(f"{base}.text")
+        return {
+            "stem": stem,
+            "count": manifest["rows"],
+            "max_sequence": manifest["max_sequence"],
+            "supersedes": manifest["supersedes"],
+            "holograms": np.load(f"{base}.holo.npy", mmap_mode='r'),
+            "rows": np.load(f"{base}.rows.npy", mmap_mode='r'),
+            "text": np.memmap(f"{base}.text", dtype=np.uint8, mode='r') if text_size else np.zeros(0, np.uint8),
+        }
+
+    def _row_data(self, sheet, row, hologram):
+        """
+        Rebuilds a crystal from its sheet row and its (already read) hologram,
+        without touching the crystal file.
+        """
+        meta = sheet["rows"][row]
+        start, length = int(meta["text_start"]), int(meta["text_len"])
+        data = json.loads(sheet["text"][start:start + length].tobytes().decode("utf-8"))
+        data['hologram'] = np.array(hologram)
+        return data
+
+    def _row_weights(self, sheet, picked):
+        rows = sheet["rows"]
+        if "mass" not in rows.dtype.names:
+            return np.full(len(picked), 0.5), np.ones(len(picked))
+        return rows["mass"][picked], rows["decay_factor"][picked]
+
+    def _write_sheet(self, folder, names, sequences, masses, decays, holograms, texts, supersedes=()):
+        """
+        Writes one sheet: holograms, row table and text blob first, manifest last.
+        Every file goes through a temp name and a rename, so readers only see whole sheets.
+        ARGS:
+            holograms: An (N x DIMENSIONS) array, or an iterable of row blocks.
+        """
+        cold_path = os.path.join(folder, COLD_DIR)
+        os.makedirs(cold_path, exist_ok=True)
+        count = len(names)
+        max_sequence = int(max(sequences, default=0))
+        stem = f"sheet_{max_sequence:012d}_{time.time_ns():020d}_{os.getpid()}_{threading.get_ident()}"
+        base = os.path.join(cold_path, stem)
+        tmp = os.path.join(cold_path, f".tmp_{stem}")
+
+        table = np.zeros(count, dtype=ROW)
+        table["name"] = [name.encode("utf-8") for name in names]
+        table["sequence"] = sequences
+        table["mass"] = masses
+        table["decay_factor"] = decays
+        offset = 0
+        with open(f"{tmp}.text", 'wb') as f:
+            for i, text in enumerate(texts):
+                f.write(text)
+                table["text_start"][i] = offset
+                table["text_len"][i] = len(text)
+                offset += len(text)
+
+        sheet = np.lib.format.open_memmap(f"{tmp}.holo.npy", mode='w+', dtype=np.complex128,
+                                          shape=(count, nest_holography.DIMENSIONS))
+        if isinstance(holograms, np.ndarray):
+            sheet[:] = holograms
+        else:
+            row = 0
+            for block in holograms:
+                sheet[row:row + len(block)] = block
+                row += len(block)
+        sheet.flush()
+        del sheet
+        np.save(f"{tmp}.rows.npy", table)
+
+        os.replace(f"{tmp}.text", f"{base}.text")
+        os.replace(f"{tmp}.holo.npy", f"{base}.holo.npy")
+        os.replace(f"{tmp}.rows.npy", f"{base}.rows.npy")
+        with open(f"{tmp}.json", 'w') as f:
+            json.dump({"rows": count, "max_sequence": max_sequence, "supersedes": list(supersedes)}, f)
+        os.replace(f"{tmp}.json", f"{base}.json")  # The publish step
+        return stem
+
+    def _freeze(self, folder, sector):
+        """
+        Packs every pending miss into one new cold sheet and releases their RAM.
+        The new sheet's blocks are offered to the Hot tier straight from memory.
+        """
+        with self.lock:
+            rows = list(sector["pending"])
+        if not rows:
+            return
+        texts = [json.dumps({k: v for k, v in row["data"].items() if k != 'hologram'},
+                            default=str).encode("utf-8") for row in rows]
+        holograms = np.stack([row["data"]['hologram'] for row in rows]).astype(np.complex128)
+        masses = np.array([row["data"].get("mass", 0.5) for row in rows], dtype=np.float64)
+        decays = np.array([row["data"].get("decay_factor", 1.0) for row in rows], dtype=np.float64)
+        stem = self._write_sheet(
+            folder,
+            [row["name"] for row in rows],
+            [row["sequence"] for row in rows],
+            masses,
+            decays,
+            holograms,
+            texts,
+        )
+        sheet = self._map_sheet(os.path.join(folder, COLD_DIR), stem)
+        with self.lock:
+            sector["sheets"][stem] = sheet
+            frozen = {id(row) for row in rows}
+            sector["pending"] = [row for row in sector["pending"] if id(row) not in frozen]
+            released = sum(row["bytes"] for row in rows)
+            sector["pending_bytes"] -= released
+            self.ram_used -= released
+        for start in range(0, len(rows), BLOCK_ROWS):
+            stop = start + BLOCK_ROWS
+            self._admit((folder, stem, start), holograms[start:stop], float(np.mean(masses[start:stop] * decays[start:stop])))
+
+    def _compact(self, folder, sector):
+        """
+        Size-tiered merge: folds the smaller half of a sector's sheets into one,
+        dropping rows that two readers both froze and rows whose crystal was deleted. One compactor per sector at a time
+        (an O_EXCL lock file); everyone else just skips, nobody waits.
+        """
+        cold_path = os.path.join(folder, COLD_DIR)
+        lock_path = os.path.join(cold_path, COMPACT_LOCK)
+        token = f"{os.getpid()}_{threading.get_ident()}_{uuid.uuid4().hex}"
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            self._break_stale_lock(lock_path)
+            return
+        with os.fdopen(fd, 'w') as f:
+            f.write(token)
+
+        last_beat = [time.time()]
+        def heartbeat():
+            # Keeps a long merge from looking abandoned to other compactors
+            if time.time() - last_beat[0] > STALE_AGE / 10 and self._owns_lock(lock_path, token):
+                os.utime(lock_path)
+                last_beat[0] = time.time()
+
+        try:
+            with self.lock:
+                sheets = sorted(sector["sheets"].values(), key=lambda s: s["count"])
+            victims = sheets[:len(sheets) - MAX_SHEETS // 2]
+            if len(victims) < 2:
+                return
+
+            # Newest sheet wins for a duplicated crystal (stems sort by sequence, then time)
+            keep, seen = [], set()
+            for sheet in sorted(victims, key=lambda s: s["stem"], reverse=True):
+                heartbeat()
+                names = sheet["rows"]["name"]
+                picked = [i for i, name in enumerate(names) if not (name in seen or seen.add(name))
+                          and os.path.exists(os.path.join(folder, name.decode("utf-8")))]
+                keep.append((sheet, np.array(picked, dtype=np.int64)))
+            del seen
+
+            def blocks():
+                for sheet, picked in keep:
+                    for start in range(0, len(picked), SCAN_BLOCK):
+                        heartbeat()
+                        yield sheet["holograms"][picked[start:start + SCAN_BLOCK]]
+
+            def texts():
+                for sheet, picked in keep:
+                    heartbeat()
+                    for i in picked:
+                        meta = sheet["rows"][i]
+                        start = int(meta["text_start"])
+                        yield sheet["text"][start:start + int(meta["text_len"])].tobytes()
+
+            names = [name.decode("utf-8") for sheet, picked in keep for name in sheet["rows"]["name"][picked]]
+            sequences = np.concatenate([sheet["rows"]["sequence"][picked] for sheet, picked in keep])
+            weights = [self._row_weights(sheet, picked) for sheet, picked in keep]
+            masses = np.concatenate([mass for mass, _ in weights])
+            decays = np.concatenate([decay for _, decay in weights])
+            supersedes = set()
+            for sheet, _ in keep:
+                supersedes.add(sheet["stem"])
+                supersedes.update(sheet["supersedes"])  # Keep predecessors hidden if their deletion failed
+
+            stem = self._write_sheet(folder, names, sequences, masses, decays, blocks(), texts(),
+                                     supersedes=sorted(supersedes))
+            if not self._owns_lock(lock_path, token):
+                return  # Stalled past STALE_AGE and was taken over: leave the old sheets alone
+            merged = self._map_sheet(cold_path, stem)
+            with self.lock:
+                sector["sheets"][stem] = merged
+                sector["retired"].update(supersedes)
+                for old in supersedes:
+                    sector["sheets"].pop(old, None)
+            self._drop_blocks(folder, supersedes)
+
+            # Readers that still map the old sheets keep working: unlinking never breaks a mapping
+            for old in supersedes:
+                for suffix in (".json", ".holo.npy", ".rows.npy", ".text"):
+                    try:
+                        os.unlink(os.path.join(cold_path, old + suffix))
+                    except OSError:
+                        pass
+            self._sweep_orphans(cold_path)
+        finally:
+            try:
+                if self._owns_lock(lock_path, token):
+                    os.unlink(lock_path)
+            except OSError:
+                pass
+
+    def _owns_lock(self, lock_path, token):
+        try:
+            with open(lock_path, 'r') as f:
+                return f.read() == token
+        except OSError:
+            return False
+
+    def _break_stale_lock(self, lock_path):
+        """
+        Removes a compaction lock whose owner stopped heart-beating (crashed).
+        The lock is renamed aside first, so only one contender can break it; if a fresh
+        lock slipped in between the age check and the rename, it is handed back.
+        """
+        try:
+            if time.time() - os.stat(lock_path).st_mtime <= STALE_AGE:
+                return
+            grave = f"{lock_path}.{os.getpid()}_{threading.get_ident()}.stale"
+            os.rename(lock_path, grave)
+            if time.time() - os.stat(grave).st_mtime <= STALE_AGE:
+                try:
+                    os.link(grave, lock_path)  # Never overwrites a newer lock
+                except OSError:
+                    pass
+            os.unlink(grave)
+        except OSError:
+            pass  # Another contender broke it first; retry on a later scan
+
+    def _sweep_orphans(self, cold_path):
+        """
+        Removes temp files and unpublished sheet parts left behind by crashed readers.
+        """
+        published = {name[:-len(".json")] for name in os.listdir(cold_path)
+                     if name.startswith("sheet_") and name.endswith(".json")}
+        cutoff = time.time() - STALE_AGE
+        for entry in os.scandir(cold_path):
+            name = entry.name
+            orphan = name.startswith(".tmp_") or (name.startswith("sheet_") and name.split(".")[0] not in published)
+            try:
+                if orphan and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                continue
+
+    # --- MISSES: INGESTING NEW CRYSTALS ---
+
+    def _stage(self, sector, name, sequence, data):
+        row = {"name": name, "sequence": sequence, "data": data,
+               "bytes": self._crystal_bytes(data), "since": time.time()}
+        with self.lock:
+            sector["pending"].append(row)
+            sector["pending_bytes"] += row["bytes"]
+            self.ram_used += row["bytes"]
+            if self.ram_used > self.ram_budget:
+                self._evict()
+
+    def _ingest(self, folder, sector, fresh, score):
+        """
+        Reads crystals that are in no sheet yet, adding their names to `fresh` (the misses)
+        and handing each to `score` as it is read.
+        1. Once per sector: crystals from before sequence ids (listed a single time).
+        2. Always: sequenced crystals between the watermark and the sector's high-water mark.
+        Misses are held in RAM (at most PENDING_SHARE of the budget) until frozen. If the
+        sector cannot be frozen (read-only), whatever does not fit is re-read from its file
+        on the next scan instead of being held.
+        """
+        writable = [True]
+
+        def freeze():
+            if writable[0]:
+                try:
+                    self._freeze(folder, sector)
+                except OSError:
+                    writable[0] = False
+
+        def admit(name, sequence, data):
+            share = self.ram_budget * PENDING_SHARE
+            size = self._crystal_bytes(data)
+            if len(sector["pending"]) >= FREEZE_ROWS or sector["pending_bytes"] + size > share:
+                freeze()
+                if sector["pending_bytes"] + size > share:
+                    return False
+            self._stage(sector, name, sequence, data)
+            return True
+
+        names, sector["spilled"] = sector["spilled"], []
+        if not sector["legacy"]:
+            names += [os.path.basename(path) for path in glob.glob(os.path.join(folder, "*.npy"))
+                      if not nest_metabolism.CRYSTAL_NAME.match(os.path.basename(path))]
+            sector["legacy"] = True  # Listed once, whether or not the freeze below succeeds
+        for name in names:
+            data = self._load_crystal(os.path.join(folder, name))
+            if data is None:
+                continue
+            fresh.add(name)
+            score(name, data)
+            if not admit(name, 0, data):
+                sector["spilled"].append(name)
+
+        # Up to the sector's high-water mark; holes left by deleted crystals are stepped over
+        holding = True
+        last = nest_metabolism.last_sequence(folder)
+        for sequence in range(sector["watermark"] + 1, last + 1):
+            path = nest_metabolism.crystal_path(folder, sequence)
+            data = self._load_crystal(path)
+            if data is None and self._is_young(path):
+                break  # Name reserved but not yet filled by its writer: pick it up next scan
+            if data is not None:
+                fresh.add(os.path.basename(path))
+                score(os.path.basename(path), data)
+                if holding and not admit(os.path.basename(path), sequence, data):
+                    holding = False  # Over budget and unfreezable: the watermark stops here
+            if holding:
+                with self.lock:
+                    sector["watermark"] = max(sector["watermark"], sequence)
+
+        pending = sector["pending"]
+        if pending and (len(pending) >= FREEZE_ROWS or time.time() - pending[0]["since"] >= FREEZE_AGE
+                        or any(row["sequence"] == 0 for row in pending)):
+            freeze()  # Legacy rows are frozen at once so the listing never has to be repeated
+
+        if (writable[0] and not sector["legacy_marked"] and not sector["spilled"]
+                and not any(row["sequence"] == 0 for row in sector["pending"])):
+            try:
+                cold_path = os.path.join(folder, COLD_DIR)
+                os.makedirs(cold_path, exist_ok=True)
+                open(os.path.join(cold_path, LEGACY_DONE), 'w').close()
+                sector["legacy_marked"] = True
+            except OSError:
+                pass
+
+    def flush(self):
+        """
+        Freezes every pending miss into cold sheets now (e.g. before shutdown).
+        """
+        for folder, sector in list(self.cold.items()):
+            with sector["ingest"]:
+                try:
+                    self._freeze(folder, sector)
+                except OSError:
+                    pass
+
+    # --- THE SCAN ---
+
+    def scan(self, folder, query_vec, threshold):
+        """
+        Resonates a query against one sector, tier by tier.
+        ARGS:
+            folder (str): The sector path.
+            query_vec (array): The encoded query.
+            threshold (float): Minimum resonance to report.
+        Returns a list of (resonance, crystal_data).
+        Safe to call from many threads; crystals are immutable once committed,
+        so nothing here ever waits on a writer. Only one thread per sector ingests
+        (and compacts) at a time; the others scan what is already there.
+        """
+        with self.lock:
+            self.clock += 1
+            now = self.clock
+        sector = self._open_cold(folder)
+        seen = {"hot_hits": 0, "cold_hits": 0, "misses": 0}
+        fresh = set()  # Names read from their own files during this scan
+
+        # Keyed by name: two readers may both have frozen the same crystal before a merge
+        found = {}
+
+        def score(name, data):
+            resonance = self.physics.calculate_resonance(query_vec, data['hologram'])
+            if resonance > threshold:
+                found[name] = (resonance, data)
+
+        if sector["ingest"].acquire(blocking=False):
+            try:
+                self._ingest(folder, sector, fresh, score)
+                if len(sector["sheets"]) > MAX_SHEETS:
+                    self._compact(folder, sector)
+            except OSError:
+                pass  # e.g. a read-only sector that cannot be compacted; we still answer
+            finally:
+                sector["ingest"].release()
+        seen["misses"] = len(fresh)
+
+        with self.lock:
+            sheets = list(sector["sheets"].values())
+            pending = list(sector["pending"])
+
+            # A scan visits every block of the sector: resident ones stay as warm as newcomers
+            for sheet in sheets:
+                for start in range(0, sheet["count"], BLOCK_ROWS):
+                    block = self.hot.get((folder, sheet["stem"], start))
+                    if block is not None:
+                        block["touched"] = now
+
+        # 1. SHEETS: One vectorized pass per block, from RAM if resident, else from disk
+        for sheet in sheets:
+            for start in range(0, sheet["count"], BLOCK_ROWS):
+                key = (folder, sheet["stem"], start)
+                block = self.hot.get(key)
+                if block is not None:
+                    holograms = block["holograms"]  # HOT: resident
+                    seen["hot_hits"] += len(holograms)
+                else:
+                    holograms = np.array(sheet["holograms"][start:start + BLOCK_ROWS])  # COLD: one read
+                    seen["cold_hits"] += len(holograms)
+                    self._admit(key, holograms, self._block_weight(sheet, start, start + len(holograms)))
+                resonances = self.physics.calculate_resonance_many(query_vec, holograms)
+                for offset in np.nonzero(resonances > threshold)[0]:
+                    row = start + int(offset)
+                    name = sheet["rows"][row]["name"].decode("utf-8")
+                    if name in found or not os.path.exists(os.path.join(folder, name)):
+                        continue  # (Deleted crystals linger in sheets until the next merge)
+                    found[name] = (resonances[offset], self._row_data(sheet, row, holograms[offset]))
+
+        # 2. PENDING: Misses not yet frozen are already resident
+        for row in pending:
+            if row["name"] in fresh:
+                continue  # Scored as it was read
+            seen["hot_hits"] += 1  # Read from its file on an earlier scan
+            if row["name"] in found:
+                continue
+            resonance = self.physics.calculate_resonance(query_vec, row["data"]['hologram'])
+            if resonance > threshold and os.path.exists(os.path.join(folder, row["name"])):
+                found[row["name"]] = (resonance, row["data"])
+
+        with self.lock:
+            for key, count in seen.items():
+                self.stats[key] += count
+        return list(found.values())
+
+    def tier_stats(self):
+        """
+        Per-tier hit rates, so hosts can be sized by working set, not history.
+        hot_hits / cold_hits: rows scanned from RAM (resident blocks, pending misses) /
+                              rows read from a cold sheet on disk.
+        misses: crystals read from their own file (new since they were last seen).
+        """
+        with self.lock:
+            return self._report()
+
+    def _report(self):
+        total = self.stats["hot_hits"] + self.stats["cold_hits"] + self.stats["misses"]
+        report = dict(self.stats)
+        report["ram_used"] = self.ram_used
+        report["ram_budget"] = self.ram_budget
+        report["hot_blocks"] = len(self.hot)
+        report["pending_crystals"] = sum(len(sector["pending"]) for sector in self.cold.values())
+        report["cold_sheets"] = sum(len(sector["sheets"]) for sector in self.cold.values())
+        for tier in ("hot", "cold"):
+            key = f"{tier}_hits"
+            report[f"{tier}_hit_rate"] = self.stats[key] / total if total else 0.0
+        report["miss_rate"] = self.stats["misses"] / total if total else 0.0
+        return report